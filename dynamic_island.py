@@ -10,29 +10,34 @@ Requirements:
 """
 from __future__ import annotations
 
+import functools
 import json
 import math
 import os
-import subprocess
+import re
 import sys
 import threading
 import time
-import webbrowser
 from pathlib import Path
 from typing import Callable
 
 from PyQt6.QtCore import (
+    QBasicTimer,
     QEasingCurve,
     QMetaObject,
+    QObject,
     QParallelAnimationGroup,
     QPoint,
     QPointF,
     QPropertyAnimation,
     QRect,
     QRectF,
+    QRunnable,
     QSequentialAnimationGroup,
     QSize,
+    QSortFilterProxyModel,
     Qt,
+    QThreadPool,
     QTimer,
     QVariantAnimation,
     pyqtProperty,
@@ -52,7 +57,11 @@ from PyQt6.QtGui import (
     QPainter,
     QPainterPath,
     QPen,
+    QPixmap,
     QRadialGradient,
+    QRegion,
+    QStandardItem,
+    QStandardItemModel,
 )
 from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtWidgets import (
@@ -64,17 +73,17 @@ from PyQt6.QtWidgets import (
     QDialogButtonBox,
     QFileDialog,
     QFormLayout,
-    QGraphicsDropShadowEffect,
-    QGraphicsOpacityEffect,
     QGridLayout,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMenu,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
     QScrollArea,
     QSizePolicy,
@@ -100,50 +109,106 @@ except ImportError:
     WINRT_AVAILABLE = False
     print("[WARN] winrt não disponível - notificações do Windows não funcionarão")
 
+# Faster config (de)serialization when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Media keys are sent through user32.keybd_event, resolved on first use
+_keybd_event = None
+
+VK_MEDIA_NEXT_TRACK = 0xB0
+VK_MEDIA_PREV_TRACK = 0xB1
+VK_MEDIA_PLAY_PAUSE = 0xB3
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+
+
+def _json_loads(data: bytes) -> dict:
+    """Parse JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: dict) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write to a temp file and swap it in, so a crash never truncates path."""
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _get_keybd_event():
+    """Return the prototyped user32.keybd_event, importing ctypes on first call."""
+    global _keybd_event
+    if _keybd_event is None:
+        import ctypes
+        keybd_event = ctypes.windll.user32.keybd_event
+        keybd_event.argtypes = [ctypes.c_ubyte, ctypes.c_ubyte, ctypes.c_uint32, ctypes.c_void_p]
+        keybd_event.restype = None
+        _keybd_event = keybd_event
+    return _keybd_event
+
+
+def _send_media_key(vk: int) -> None:
+    """Press and release a media virtual key."""
+    keybd_event = _get_keybd_event()
+    keybd_event(vk, 0, KEYEVENTF_EXTENDEDKEY, 0)
+    keybd_event(vk, 0, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP, 0)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # SVG Icons (Base64-like inline strings for portability)
 # ──────────────────────────────────────────────────────────────────────────────
 
-ICON_WHATSAPP = """
+ICON_WHATSAPP = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M17.472 14.382c-.297-.149-1.758-.867-2.03-.967-.273-.099-.471-.148-.67.15-.197.297-.767.966-.94 1.164-.173.199-.347.223-.644.075-.297-.15-1.255-.463-2.39-1.475-.883-.788-1.48-1.761-1.653-2.059-.173-.297-.018-.458.13-.606.134-.133.298-.347.446-.52.149-.174.198-.298.298-.497.099-.198.05-.371-.025-.52-.075-.149-.669-1.612-.916-2.207-.242-.579-.487-.5-.669-.51-.173-.008-.371-.01-.57-.01-.198 0-.52.074-.792.372-.272.297-1.04 1.016-1.04 2.479 0 1.462 1.065 2.875 1.213 3.074.149.198 2.096 3.2 5.077 4.487.709.306 1.262.489 1.694.625.712.227 1.36.195 1.871.118.571-.085 1.758-.719 2.006-1.413.248-.694.248-1.289.173-1.413-.074-.124-.272-.198-.57-.347z" fill="#25D366"/>
   <path d="M12 2C6.477 2 2 6.477 2 12c0 1.89.525 3.66 1.438 5.168L2 22l4.932-1.41A9.953 9.953 0 0012 22c5.523 0 10-4.477 10-10S17.523 2 12 2zm0 18c-1.66 0-3.203-.506-4.483-1.371l-.32-.192-2.933.84.877-2.858-.21-.334A7.948 7.948 0 014 12c0-4.411 3.589-8 8-8s8 3.589 8 8-3.589 8-8 8z" fill="#25D366"/>
 </svg>
 """
 
-ICON_FACEBOOK = """
+ICON_FACEBOOK = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M24 12c0-6.627-5.373-12-12-12S0 5.373 0 12c0 5.99 4.388 10.954 10.125 11.854V15.47H7.078V12h3.047V9.356c0-3.007 1.792-4.669 4.533-4.669 1.312 0 2.686.235 2.686.235v2.953H15.83c-1.491 0-1.956.925-1.956 1.874V12h3.328l-.532 3.469h-2.796v8.385C19.612 22.954 24 17.99 24 12z" fill="#1877F2"/>
 </svg>
 """
 
-ICON_LINKEDIN = """
+ICON_LINKEDIN = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433c-1.144 0-2.063-.926-2.063-2.065 0-1.138.92-2.063 2.063-2.063 1.14 0 2.064.925 2.064 2.063 0 1.139-.925 2.065-2.064 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z" fill="#0A66C2"/>
 </svg>
 """
 
-ICON_VSCODE = """
+ICON_VSCODE = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M23.15 2.587L18.21.21a1.494 1.494 0 00-1.705.29l-9.46 8.63-4.12-3.128a.999.999 0 00-1.276.057L.327 7.261A1 1 0 00.326 8.74L3.899 12 .326 15.26a1 1 0 00.001 1.479L1.65 17.94a.999.999 0 001.276.057l4.12-3.128 9.46 8.63a1.492 1.492 0 001.704.29l4.942-2.377A1.5 1.5 0 0024 20.06V3.939a1.5 1.5 0 00-.85-1.352zm-5.146 14.861L10.826 12l7.178-5.448v10.896z" fill="#007ACC"/>
 </svg>
 """
 
-ICON_BRAVE = """
+ICON_BRAVE = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M12 0L8.934.002l.002.002L7.548 1.9H5.2l.678 2.006-.946 1.08.946 1.45-.4.68 1.144 1.932-.478.968 1.3 2.39-.18.37 1.702 4.254.034.152 1.2 3.398.8 1.64L12 24l.9-1.78.8-1.64 1.2-3.398.034-.152 1.702-4.254-.18-.37 1.3-2.39-.478-.968 1.144-1.932-.4-.68.946-1.45-.946-1.08.678-2.006h-2.348L13.066.004l.002-.002L12 0z" fill="#FB542B"/>
 </svg>
 """
 
-ICON_NOTES = """
+ICON_NOTES = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <rect x="3" y="3" width="18" height="18" rx="3" fill="#FFE066"/>
   <path d="M7 8h10M7 12h10M7 16h6" stroke="#333" stroke-width="1.5" stroke-linecap="round"/>
 </svg>
 """
 
-ICON_MUSIC = """
+ICON_MUSIC = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <circle cx="12" cy="12" r="10" fill="url(#musicGrad)"/>
   <path d="M9.5 8.5L14.5 12L9.5 15.5V8.5z" fill="#fff"/>
@@ -156,68 +221,68 @@ ICON_MUSIC = """
 </svg>
 """
 
-ICON_PREV = """
+ICON_PREV = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M6 6h2v12H6V6zm3.5 6l8.5 6V6l-8.5 6z" fill="#E0E0E0"/>
 </svg>
 """
 
-ICON_PLAY = """
+ICON_PLAY = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M8 5v14l11-7z" fill="#E0E0E0"/>
 </svg>
 """
 
-ICON_PAUSE = """
+ICON_PAUSE = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M6 4h4v16H6V4zm8 0h4v16h-4V4z" fill="#E0E0E0"/>
 </svg>
 """
 
-ICON_NEXT = """
+ICON_NEXT = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M6 18l8.5-6L6 6v12zM16 6v12h2V6h-2z" fill="#E0E0E0"/>
 </svg>
 """
 
-ICON_CLOSE = """
+ICON_CLOSE = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z" fill="#FF4444"/>
 </svg>
 """
 
-ICON_SETTINGS = """
+ICON_SETTINGS = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M19.14,12.94c0.04-0.3,0.06-0.61,0.06-0.94c0-0.32-0.02-0.64-0.07-0.94l2.03-1.58c0.18-0.14,0.23-0.41,0.12-0.61 l-1.92-3.32c-0.12-0.22-0.37-0.29-0.59-0.22l-2.39,0.96c-0.5-0.38-1.03-0.7-1.62-0.94L14.4,2.81c-0.04-0.24-0.24-0.41-0.48-0.41 h-3.84c-0.24,0-0.43,0.17-0.47,0.41L9.25,5.35C8.66,5.59,8.12,5.92,7.63,6.29L5.24,5.33c-0.22-0.08-0.47,0-0.59,0.22L2.74,8.87 C2.62,9.08,2.66,9.34,2.86,9.48l2.03,1.58C4.84,11.36,4.8,11.69,4.8,12s0.02,0.64,0.07,0.94l-2.03,1.58 c-0.18,0.14-0.23,0.41-0.12,0.61l1.92,3.32c0.12,0.22,0.37,0.29,0.59,0.22l2.39-0.96c0.5,0.38,1.03,0.7,1.62,0.94l0.36,2.54 c0.05,0.24,0.24,0.41,0.48,0.41h3.84c0.24,0,0.44-0.17,0.47-0.41l0.36-2.54c0.59-0.24,1.13-0.56,1.62-0.94l2.39,0.96 c0.22,0.08,0.47,0,0.59-0.22l1.92-3.32c0.12-0.22,0.07-0.47-0.12-0.61L19.14,12.94z M12,15.6c-1.98,0-3.6-1.62-3.6-3.6 s1.62-3.6,3.6-3.6s3.6,1.62,3.6,3.6S13.98,15.6,12,15.6z" fill="#888888"/>
 </svg>
 """
 
-ICON_BELL = """
+ICON_BELL = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M12 22c1.1 0 2-.9 2-2h-4c0 1.1.89 2 2 2zm6-6v-5c0-3.07-1.64-5.64-4.5-6.32V4c0-.83-.67-1.5-1.5-1.5s-1.5.67-1.5 1.5v.68C7.63 5.36 6 7.92 6 11v5l-2 2v1h16v-1l-2-2z" fill="#FFD700"/>
 </svg>
 """
 
-ICON_PIN = """
+ICON_PIN = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M16 12V4h1V2H7v2h1v8l-2 2v2h5.2v6h1.6v-6H18v-2l-2-2z" fill="#888888"/>
 </svg>
 """
 
-ICON_PIN_ACTIVE = """
+ICON_PIN_ACTIVE = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M16 12V4h1V2H7v2h1v8l-2 2v2h5.2v6h1.6v-6H18v-2l-2-2z" fill="#4CAF50"/>
 </svg>
 """
 
-ICON_DND = """
+ICON_DND = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <circle cx="12" cy="12" r="10" fill="#888888"/>
   <rect x="7" y="11" width="10" height="2" fill="#1a1a1a"/>
 </svg>
 """
 
-ICON_DND_ACTIVE = """
+ICON_DND_ACTIVE = b"""
 <svg viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
   <circle cx="12" cy="12" r="10" fill="#E53935"/>
   <rect x="7" y="11" width="10" height="2" fill="#FFFFFF"/>
@@ -225,20 +290,100 @@ ICON_DND_ACTIVE = """
 """
 
 
+def _minify(svg: bytes) -> bytes:
+    """Strip formatting QSvgRenderer would otherwise have to tokenize."""
+    svg = re.sub(rb">\s+<", b"><", svg)
+    svg = re.sub(rb"\s{2,}", b" ", svg)
+    svg = svg.replace(b" />", b"/>")
+    # QSvgRenderer matches element names without namespace processing
+    svg = re.sub(rb'\s+xmlns="[^"]*"', b"", svg)
+    return svg.strip()
+
+
+# Minify every icon once at import
+for _name, _svg in list(globals().items()):
+    if _name.startswith("ICON_"):
+        globals()[_name] = _minify(_svg)
+del _name, _svg
+
+# Icons an app entry can reference by "icon_name" in the config
+APP_ICONS: dict[str, bytes] = {
+    "ICON_WHATSAPP": ICON_WHATSAPP,
+    "ICON_FACEBOOK": ICON_FACEBOOK,
+    "ICON_LINKEDIN": ICON_LINKEDIN,
+    "ICON_VSCODE": ICON_VSCODE,
+    "ICON_BRAVE": ICON_BRAVE,
+    "ICON_NOTES": ICON_NOTES,
+    "ICON_MUSIC": ICON_MUSIC,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _text_icon(text: str, color: str) -> bytes:
+    """Build the SVG for an emoji/text icon once per (text, color)."""
+    return _minify(f'''<svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
+        <text x="12" y="16" text-anchor="middle" font-size="14" fill="{color}">{text}</text>
+    </svg>'''.encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=None)
+def _dot_icon(color: str) -> bytes:
+    """Build the default circle icon once per color."""
+    return _minify(f'''<svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
+        <circle cx="12" cy="12" r="8" fill="{color}"/>
+    </svg>'''.encode("utf-8"))
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Custom Animated Button
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=None)
+def _get_renderer(svg: bytes) -> QSvgRenderer:
+    """Return a shared renderer so each unique icon is parsed only once."""
+    return QSvgRenderer(svg)
+
+
+# Rasterized icons keyed by (svg, width, height, device pixel ratio)
+_SVG_PIXMAP_CACHE: dict[tuple[bytes, int, int, float], QPixmap] = {}
+
+
+def _render_svg(svg: bytes, w: int, h: int, dpr: float) -> QPixmap:
+    """Return svg rasterized at w x h logical pixels, shared by all buttons."""
+    key = (svg, w, h, dpr)
+    pixmap = _SVG_PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(QSize(math.ceil(w * dpr), math.ceil(h * dpr)))
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        _get_renderer(svg).render(painter, QRectF(pixmap.rect()))
+        painter.end()
+        pixmap.setDevicePixelRatio(dpr)
+        _SVG_PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+
 class GlowButton(QWidget):
     """A sleek animated button with SVG icon, glow effect and scale animation."""
 
     SIZE = 54
     ICON_SIZE = 28
+    # Largest scale reached by the press/release bounce; the icon is
+    # rasterized at this size so the cached pixmap is only ever scaled down.
+    ICON_MAX_SCALE = 1.25
+    # Radius of the outermost glow ring relative to the button radius
+    GLOW_EXTENT = 2.4
+
+    # Shared paint colors (top, bottom) of the background gradient
+    _BG_IDLE = (QColor(55, 55, 58), QColor(35, 35, 38))
+    _BG_HOVER = (QColor(70, 70, 75), QColor(45, 45, 48))
+    _HIGHLIGHT_END = QColor(255, 255, 255, 0)
 
     def __init__(
         self,
-        svg_data: str,
+        svg_data: bytes,
         tooltip: str,
         callback: Callable[[], None],
         accent_color: str = "#ffffff",
@@ -248,11 +393,25 @@ class GlowButton(QWidget):
         self.tooltip_text = tooltip
         self.callback = callback
         self.accent = QColor(accent_color)
+        self._accent_rgb = self.accent.getRgbF()[:3]
         self._scale = 1.0
         self._glow = 0.0
         self._pressed = False
-
+        self._alpha = 1.0  # Overall opacity, faded by the island's contentOpacity
+        # Values used by the last paint, to drop sub-pixel animation frames
+        self._painted_scale = self._scale
+        self._painted_glow = self._glow
+        # Per-button paint state whose alpha follows the glow
+        self._border_color = QColor(90, 90, 95)
+        self._border_pen = QPen(self._border_color, 1.5)
+        self._highlight_color = QColor(255, 255, 255)
+
+        # Fixed geometry (radius, icon half-size) plus the size-dependent
+        # centers, refreshed by resizeEvent
+        self._base_radius = self.SIZE / 2 - 4
+        self._icon_half = self.ICON_SIZE / 2
         self.setFixedSize(self.SIZE, self.SIZE)
+        self._update_geometry_cache()
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.setToolTip(tooltip)
 
@@ -264,6 +423,11 @@ class GlowButton(QWidget):
         self._glow_anim = QPropertyAnimation(self, b"glow")
         self._glow_anim.setDuration(300)
         self._glow_anim.setEasingCurve(QEasingCurve.Type.InOutSine)
+
+        # Scale and glow share one group so they tick off a single timer
+        self._hover_group = QParallelAnimationGroup(self)
+        self._hover_group.addAnimation(self._scale_anim)
+        self._hover_group.addAnimation(self._glow_anim)
         
         # Rotation animation for extra flair
         self._rotation = 0.0
@@ -271,14 +435,75 @@ class GlowButton(QWidget):
         self._rotation_anim.setDuration(150)
         self._rotation_anim.setEasingCurve(QEasingCurve.Type.OutBack)
 
-        self.renderer = QSvgRenderer(self.svg_data.encode())
+        # Pixmaps are fetched on first paint, so buttons that are never
+        # shown never parse or rasterize anything.
+        self._icon_pixmap = None
+        self._glow_half = self._base_radius * self.GLOW_EXTENT
+        self._glow_pixmap = None
 
-    def setIcon(self, svg_data: str) -> None:
+    def setIcon(self, svg_data: bytes) -> None:
         """Update the button's SVG icon."""
         self.svg_data = svg_data
-        self.renderer = QSvgRenderer(self.svg_data.encode())
+        self._icon_pixmap = None
+        self.update()
+
+    def setAccent(self, accent_color: str) -> None:
+        """Update the accent color of the hover glow."""
+        accent = QColor(accent_color)
+        if accent == self.accent:
+            return
+        self.accent = accent
+        self._accent_rgb = accent.getRgbF()[:3]
+        self._glow_pixmap = None
+        self.update()
+
+    def setAlpha(self, alpha: float) -> None:
+        """Set the opacity the whole button is painted with."""
+        if alpha == self._alpha:
+            return
+        self._alpha = alpha
         self.update()
 
+    def _update_geometry_cache(self) -> None:
+        """Recompute the paint geometry that only depends on the widget size."""
+        w, h = self.width(), self.height()
+        self._center = QPointF(w / 2, h / 2)
+        cx, cy = w // 2, h // 2
+        self._idle_center = QPointF(cx, cy)
+        half = self.ICON_SIZE // 2
+        self._idle_icon_rect = QRect(cx - half, cy - half, self.ICON_SIZE, self.ICON_SIZE)
+
+    def _render_icon_pixmap(self) -> QPixmap:
+        """Fetch the rasterized SVG icon so painting only has to blit it."""
+        side = math.ceil(self.ICON_SIZE * self.ICON_MAX_SCALE)
+        return _render_svg(self.svg_data, side, side, self.devicePixelRatioF())
+
+    def _render_glow_pixmap(self) -> QPixmap:
+        """Pre-render the full-strength glow; painting only scales and fades it."""
+        dpr = self.devicePixelRatioF()
+        side = math.ceil(self._glow_half * 2 * dpr)
+        pixmap = QPixmap(QSize(side, side))
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.scale(dpr, dpr)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        center = QPointF(side / dpr / 2, side / dpr / 2)
+        radius = self._base_radius
+        mid_color = QColor.fromRgbF(*self._accent_rgb, 30 / 255)
+        for i in range(3):
+            glow_radius = radius * (1.8 + i * 0.3)
+            gradient = QRadialGradient(center, glow_radius)
+            gradient.setColorAt(0, QColor.fromRgbF(*self._accent_rgb, 0.15 * (1 - i * 0.3)))
+            gradient.setColorAt(0.5, mid_color)
+            gradient.setColorAt(1, Qt.GlobalColor.transparent)
+            painter.setBrush(gradient)
+            painter.drawEllipse(center, glow_radius, glow_radius)
+        painter.end()
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
     # ─── Qt properties for animation ──────────────────────────────────────────
     @pyqtProperty(float)
     def scale(self) -> float:
@@ -287,7 +512,11 @@ class GlowButton(QWidget):
     @scale.setter
     def scale(self, value: float) -> None:
         self._scale = value
-        self.update()
+        # Skip frames where the circle would grow by less than a device pixel,
+        # but always paint the final value so the button settles exactly
+        radius_delta = abs(value - self._painted_scale) * self._base_radius
+        if radius_delta * self.devicePixelRatioF() >= 1.0 or value == self._scale_anim.endValue():
+            self.update()
 
     @pyqtProperty(float)
     def glow(self) -> float:
@@ -296,7 +525,10 @@ class GlowButton(QWidget):
     @glow.setter
     def glow(self, value: float) -> None:
         self._glow = value
-        self.update()
+        # Skip frames where the glow opacity would not change a single step,
+        # but always paint the final value so the glow settles exactly
+        if abs(value - self._painted_glow) >= 1 / 255 or value == self._glow_anim.endValue():
+            self.update()
 
     @pyqtProperty(float)
     def rotation(self) -> float:
@@ -308,13 +540,15 @@ class GlowButton(QWidget):
         self.update()
 
     # ─── Events ───────────────────────────────────────────────────────────────
+    def resizeEvent(self, event) -> None:
+        self._update_geometry_cache()
+        super().resizeEvent(event)
+
     def enterEvent(self, _event) -> None:
-        self._animate_scale(1.15)
-        self._animate_glow(1.0)
+        self._animate_hover(True)
 
     def leaveEvent(self, _event) -> None:
-        self._animate_scale(1.0)
-        self._animate_glow(0.0)
+        self._animate_hover(False)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
@@ -332,17 +566,21 @@ class GlowButton(QWidget):
             if self.rect().contains(event.pos()):
                 self.callback()
 
+    def _animate_hover(self, hovered: bool) -> None:
+        self._animate_group(1.15 if hovered else 1.0, 1.0 if hovered else 0.0)
+
     def _animate_scale(self, target: float) -> None:
-        self._scale_anim.stop()
-        self._scale_anim.setStartValue(self._scale)
-        self._scale_anim.setEndValue(target)
-        self._scale_anim.start()
+        # Press/bounce only changes scale; keep the glow heading where it was
+        glow_target = self._glow_anim.endValue()
+        self._animate_group(target, self._glow if glow_target is None else glow_target)
 
-    def _animate_glow(self, target: float) -> None:
-        self._glow_anim.stop()
+    def _animate_group(self, scale: float, glow: float) -> None:
+        self._hover_group.stop()
+        self._scale_anim.setStartValue(self._scale)
+        self._scale_anim.setEndValue(scale)
         self._glow_anim.setStartValue(self._glow)
-        self._glow_anim.setEndValue(target)
-        self._glow_anim.start()
+        self._glow_anim.setEndValue(glow)
+        self._hover_group.start()
     
     def _animate_rotation(self, target: float) -> None:
         self._rotation_anim.stop()
@@ -350,64 +588,89 @@ class GlowButton(QWidget):
         self._rotation_anim.setEndValue(target)
         self._rotation_anim.start()
 
-    def paintEvent(self, _event) -> None:
+    def paintEvent(self, event) -> None:
+        self._painted_scale = self._scale
+        self._painted_glow = self._glow
+        if self._alpha <= 0.0:
+            return
+
+        # (Re)rasterize on first paint or after moving to a screen with another DPR
+        dpr = self.devicePixelRatioF()
+        if self._icon_pixmap is None or self._icon_pixmap.devicePixelRatio() != dpr:
+            self._icon_pixmap = self._render_icon_pixmap()
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        if self._alpha < 1.0:
+            painter.setOpacity(self._alpha)
+
+        # Idle fast path (no animation running): no transform, no glow and
+        # pixel-aligned integer geometry for the circle and the icon.
+        if self._scale == 1.0 and self._glow == 0.0 and self._rotation == 0.0:
+            self._paint_body(painter, self._idle_center, self.SIZE // 2 - 4)
+            painter.drawPixmap(self._idle_icon_rect, self._icon_pixmap)
+            return
 
-        center = QPointF(self.width() / 2, self.height() / 2)
-        radius = (self.SIZE / 2 - 4) * self._scale
+        center = self._center
+        radius = self._base_radius * self._scale
         
         # Apply rotation transform
         painter.translate(center)
         painter.rotate(self._rotation)
         painter.translate(-center)
 
-        # Outer glow (larger, more diffuse)
+        # Outer glow (larger, more diffuse), faded in from the cached pixmap
         if self._glow > 0.01:
-            for i in range(3):
-                glow_color = QColor(self.accent)
-                glow_color.setAlphaF(0.15 * self._glow * (1 - i * 0.3))
-                glow_radius = radius * (1.8 + i * 0.3)
-                gradient = QRadialGradient(center, glow_radius)
-                gradient.setColorAt(0, glow_color)
-                gradient.setColorAt(0.5, QColor(self.accent.red(), self.accent.green(), self.accent.blue(), int(30 * self._glow)))
-                gradient.setColorAt(1, QColor(0, 0, 0, 0))
-                painter.setBrush(gradient)
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.drawEllipse(center, glow_radius, glow_radius)
+            glow_half = self._glow_half * self._scale
+            glow_rect = QRectF(
+                center.x() - glow_half,
+                center.y() - glow_half,
+                glow_half * 2,
+                glow_half * 2,
+            )
+            if event.region().intersects(glow_rect.toAlignedRect()):
+                if self._glow_pixmap is None or self._glow_pixmap.devicePixelRatio() != dpr:
+                    self._glow_pixmap = self._render_glow_pixmap()
+                painter.setOpacity(self._glow * self._alpha)
+                painter.drawPixmap(glow_rect, self._glow_pixmap, QRectF(self._glow_pixmap.rect()))
+                painter.setOpacity(self._alpha)
+
+        self._paint_body(painter, center, radius)
+
+        # Icon
+        icon_half = self._icon_half * self._scale
+        icon_rect = QRectF(
+            center.x() - icon_half,
+            center.y() - icon_half,
+            icon_half * 2,
+            icon_half * 2,
+        )
+        painter.drawPixmap(icon_rect, self._icon_pixmap, QRectF(self._icon_pixmap.rect()))
 
+    def _paint_body(self, painter: QPainter, center: QPointF, radius: float) -> None:
+        """Paint the background circle, its border and the top highlight."""
         # Background circle with gradient
         bg_gradient = QRadialGradient(center.x(), center.y() - radius * 0.3, radius * 1.5)
-        if self._glow < 0.5:
-            bg_gradient.setColorAt(0, QColor(55, 55, 58))
-            bg_gradient.setColorAt(1, QColor(35, 35, 38))
-        else:
-            bg_gradient.setColorAt(0, QColor(70, 70, 75))
-            bg_gradient.setColorAt(1, QColor(45, 45, 48))
+        bg_top, bg_bottom = self._BG_IDLE if self._glow < 0.5 else self._BG_HOVER
+        bg_gradient.setColorAt(0, bg_top)
+        bg_gradient.setColorAt(1, bg_bottom)
         
         painter.setBrush(bg_gradient)
-        painter.setPen(QPen(QColor(90, 90, 95, int(150 + 105 * self._glow)), 1.5))
+        self._border_color.setAlpha(int(150 + 105 * self._glow))
+        self._border_pen.setColor(self._border_color)
+        painter.setPen(self._border_pen)
         painter.drawEllipse(center, radius, radius)
         
         # Inner highlight (top)
         highlight = QLinearGradient(center.x(), center.y() - radius, center.x(), center.y())
-        highlight.setColorAt(0, QColor(255, 255, 255, int(25 + 20 * self._glow)))
-        highlight.setColorAt(1, QColor(255, 255, 255, 0))
+        self._highlight_color.setAlpha(int(25 + 20 * self._glow))
+        highlight.setColorAt(0, self._highlight_color)
+        highlight.setColorAt(1, self._HIGHLIGHT_END)
         painter.setBrush(highlight)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(center, radius * 0.9, radius * 0.9)
 
-        # Icon
-        icon_size = self.ICON_SIZE * self._scale
-        icon_rect = QRectF(
-            center.x() - icon_size / 2,
-            center.y() - icon_size / 2,
-            icon_size,
-            icon_size,
-        )
-        self.renderer.render(painter, icon_rect)
-
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Settings Dialog
@@ -430,10 +693,12 @@ class SettingsDialog(QDialog):
     
     def _load_config(self) -> dict:
         """Load configuration from JSON file."""
-        if self.config_path.exists():
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return self._get_default_config()
+        # Open directly instead of stat-ing first (orjson's error type
+        # subclasses json.JSONDecodeError)
+        try:
+            return _json_loads(self.config_path.read_bytes())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return self._get_default_config()
     
     def _get_default_config(self) -> dict:
         """Return default configuration."""
@@ -527,18 +792,27 @@ class SettingsDialog(QDialog):
     
     def _populate_app_list(self) -> None:
         """Populate the app list widget."""
-        self.app_list.clear()
-        for app in self.config.get("apps", []):
-            status = "✅" if app.get("enabled", True) else "❌"
-            app_type = "🌐" if app.get("type") == "url" else "💻" if app.get("type") == "local" else "⭐"
-            item_text = f"{status} {app_type} {app.get('name', 'Sem nome')}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, app)
-            self.app_list.addItem(item)
+        # Relayout/repaint once after all items are in
+        self.app_list.setUpdatesEnabled(False)
+        try:
+            self.app_list.clear()
+            for app in self.config.get("apps", []):
+                status = "✅" if app.get("enabled", True) else "❌"
+                app_type = "🌐" if app.get("type") == "url" else "💻" if app.get("type") == "local" else "⭐"
+                item_text = f"{status} {app_type} {app.get('name', 'Sem nome')}"
+                item = QListWidgetItem(item_text)
+                item.setData(Qt.ItemDataRole.UserRole, app)
+                self.app_list.addItem(item)
+        finally:
+            self.app_list.setUpdatesEnabled(True)
+    
+    def _apps_cache_path(self) -> Path:
+        """Return where the installed-apps scan result is cached."""
+        return self.config_path.parent / "apps_cache.json"
     
     def _add_app(self) -> None:
         """Add a new app to the list."""
-        dialog = AppEditorDialog(None, self)
+        dialog = AppEditorDialog(None, self, self._apps_cache_path())
         if dialog.exec() == QDialog.DialogCode.Accepted:
             new_app = dialog.get_app_data()
             self.config["apps"].append(new_app)
@@ -552,7 +826,7 @@ class SettingsDialog(QDialog):
             return
         
         app_data = current_item.data(Qt.ItemDataRole.UserRole)
-        dialog = AppEditorDialog(app_data, self)
+        dialog = AppEditorDialog(app_data, self, self._apps_cache_path())
         if dialog.exec() == QDialog.DialogCode.Accepted:
             updated_app = dialog.get_app_data()
             idx = self.app_list.currentRow()
@@ -592,18 +866,45 @@ class SettingsDialog(QDialog):
         self.config["auto_collapse_delay"] = self.collapse_delay_spin.value()
         self.config["expanded_width"] = self.expanded_width_spin.value()
         
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        _write_bytes_atomic(self.config_path, _json_dumps(self.config))
         
         self.accept()
 
 
+class _AppScanSignals(QObject):
+    """Signals for _AppScanTask (QRunnable itself is not a QObject)."""
+
+    finished = pyqtSignal(list)
+
+
+class _AppScanTask(QRunnable):
+    """Runs the installed-apps scan on the global thread pool."""
+
+    def __init__(self, scan: Callable[[], list[tuple[str, str]]]) -> None:
+        super().__init__()
+        self.scan = scan
+        self.signals = _AppScanSignals()
+
+    def run(self) -> None:
+        try:
+            apps = self.scan()
+        except Exception:
+            apps = []
+        self.signals.finished.emit(apps)
+
+
 class AppEditorDialog(QDialog):
     """Dialog for adding/editing individual apps."""
 
-    def __init__(self, app_data: dict | None, parent=None) -> None:
+    # Uninstallers, updaters and other helper executables hidden from the scan
+    _SKIP_EXE_RE = re.compile(r"unins|update|install|setup|crash|helper|service|launcher")
+
+    def __init__(self, app_data: dict | None, parent=None, apps_cache_path: Path | None = None) -> None:
         super().__init__(parent)
         self.app_data = app_data or {}
+        self.apps_cache_path = apps_cache_path
+        self._scan_signals = None
+        self._scan_progress = None
         
         self.setWindowTitle("Adicionar/Editar App" if app_data else "Adicionar App")
         self.setMinimumWidth(500)
@@ -640,9 +941,9 @@ class AppEditorDialog(QDialog):
         browse_btn = QPushButton("📂 Procurar")
         browse_btn.clicked.connect(self._browse_file)
         path_layout.addWidget(browse_btn)
-        scan_btn = QPushButton("🔍 Scanear Apps")
-        scan_btn.clicked.connect(self._scan_installed_apps)
-        path_layout.addWidget(scan_btn)
+        self._scan_btn = QPushButton("🔍 Scanear Apps")
+        self._scan_btn.clicked.connect(self._scan_installed_apps)
+        path_layout.addWidget(self._scan_btn)
         layout.addRow("Caminho/Comando:", path_layout)
         
         # Color
@@ -828,10 +1129,35 @@ class AppEditorDialog(QDialog):
         dialog.close()
     
     def _scan_installed_apps(self) -> None:
-        """Scan and show installed Windows apps."""
-        # Get apps (optimized, should be fast)
-        apps = self._find_installed_apps()
-        
+        """Scan installed Windows apps in the background, then show them."""
+        self._scan_btn.setEnabled(False)
+        self._scan_progress = QProgressDialog("🔍 Procurando aplicativos instalados...", "", 0, 0, self)
+        self._scan_progress.setWindowTitle("Apps")
+        self._scan_progress.setCancelButton(None)
+        # Block the editor until the result arrives so it can't be closed mid-scan
+        self._scan_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._scan_progress.setMinimumDuration(0)
+        self._scan_progress.show()
+        
+        task = _AppScanTask(self._load_installed_apps)
+        task.signals.finished.connect(self._on_apps_scanned)
+        # Keep the signals object alive until the queued result is delivered
+        self._scan_signals = task.signals
+        QThreadPool.globalInstance().start(task)
+    
+    @pyqtSlot(list)
+    def _on_apps_scanned(self, apps: list) -> None:
+        """Receive the scan result on the UI thread."""
+        self._scan_signals = None
+        self._scan_progress.close()
+        self._scan_btn.setEnabled(True)
+        # The editor may have been dismissed while the scan ran
+        if not self.isVisible():
+            return
+        self._show_app_picker(apps)
+    
+    def _show_app_picker(self, apps: list[tuple[str, str]]) -> None:
+        """Show the installed apps and copy the selected one into the form."""
         if not apps:
             QMessageBox.information(self, "Apps", "Nenhum app encontrado.")
             return
@@ -852,29 +1178,38 @@ class AppEditorDialog(QDialog):
         search_box.setPlaceholderText("🔍 Digite para filtrar (ex: chrome, spotify, discord)...")
         layout.addWidget(search_box)
         
-        # App list
-        app_list = QListWidget()
+        # App list (filtered by a proxy model, so matching runs in Qt)
+        model = QStandardItemModel(dialog)
+        items = []
         for app_name, app_path in sorted(apps):
             # Show different icons for system vs installed apps
             icon = "🪟" if app_path in ["calc", "notepad", "mspaint", "wordpad", "cmd", "powershell", "explorer"] else "📱"
-            item = QListWidgetItem(f"{icon} {app_name}")
-            item.setData(Qt.ItemDataRole.UserRole, (app_name, app_path))
+            item = QStandardItem(f"{icon} {app_name}")
+            item.setData((app_name, app_path), Qt.ItemDataRole.UserRole)
             item.setToolTip(app_path)  # Show path on hover
-            app_list.addItem(item)
+            item.setEditable(False)
+            items.append(item)
+        # One insertion for all rows instead of a rowsInserted signal per app
+        model.invisibleRootItem().appendRows(items)
+        
+        proxy = QSortFilterProxyModel(dialog)
+        proxy.setSourceModel(model)
+        proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        
+        app_list = QListView()
+        app_list.setModel(proxy)
         
         # Search functionality
         def filter_apps():
-            search_text = search_box.text().lower()
-            visible_count = 0
-            for i in range(app_list.count()):
-                item = app_list.item(i)
-                is_visible = search_text in item.text().lower()
-                item.setHidden(not is_visible)
-                if is_visible:
-                    visible_count += 1
-            info_label.setText(f"📱 {visible_count} de {len(apps)} apps")
-        
-        search_box.textChanged.connect(filter_apps)
+            proxy.setFilterFixedString(search_box.text())
+            info_label.setText(f"📱 {proxy.rowCount()} de {len(apps)} apps")
+        
+        # Filter once typing pauses instead of on every keystroke
+        filter_timer = QTimer(dialog)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(80)
+        filter_timer.timeout.connect(filter_apps)
+        search_box.textChanged.connect(lambda _text: filter_timer.start())
         layout.addWidget(app_list)
         
         # Buttons
@@ -891,32 +1226,39 @@ class AppEditorDialog(QDialog):
         
         # Show dialog
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            current = app_list.currentItem()
-            if current:
+            current = app_list.currentIndex()
+            if current.isValid():
                 app_name, app_path = current.data(Qt.ItemDataRole.UserRole)
                 self.name_edit.setText(app_name)
                 self.path_edit.setText(app_path)
     
-    def _find_installed_apps(self) -> list[tuple[str, str]]:
-        """Find installed Windows applications (optimized)."""
-        apps = []
-        max_apps = 200  # Limit to prevent slowdown
+    def _load_installed_apps(self) -> list[tuple[str, str]]:
+        """Return installed apps, rescanning only if an app folder changed."""
+        mtimes = self._installed_apps_signature()
         
-        # Add common Windows apps first (instant)
-        common_apps = [
-            ("Calculadora", "calc"),
-            ("Bloco de Notas", "notepad"),
-            ("Paint", "mspaint"),
-            ("WordPad", "wordpad"),
-            ("Prompt de Comando", "cmd"),
-            ("PowerShell", "powershell"),
-            ("Explorador de Arquivos", "explorer"),
-            ("Ferramenta de Captura", "snippingtool"),
-        ]
-        apps.extend(common_apps)
+        if self.apps_cache_path is not None:
+            try:
+                with open(self.apps_cache_path, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                if cache.get("dirs") == mtimes:
+                    return [tuple(app) for app in cache.get("apps", [])]
+            except (OSError, ValueError):
+                pass
         
-        # Add popular apps with known paths
-        popular_apps = [
+        apps = self._find_installed_apps()
+        
+        if self.apps_cache_path is not None:
+            try:
+                with open(self.apps_cache_path, 'w', encoding='utf-8') as f:
+                    json.dump({"dirs": mtimes, "apps": apps}, f, ensure_ascii=False)
+            except OSError:
+                pass
+        return apps
+    
+    @staticmethod
+    def _popular_app_paths() -> list[tuple[str, str]]:
+        """Known install locations of popular apps (may carry launch args)."""
+        return [
             ("WhatsApp", os.path.join(os.environ.get("LOCALAPPDATA", ""), "WhatsApp", "WhatsApp.exe")),
             ("WhatsApp", os.path.join(os.environ.get("LOCALAPPDATA", ""), "Programs", "whatsapp-desktop", "WhatsApp.exe")),
             ("Spotify", os.path.join(os.environ.get("APPDATA", ""), "Spotify", "Spotify.exe")),
@@ -934,70 +1276,133 @@ class AppEditorDialog(QDialog):
             ("Notion", os.path.join(os.environ.get("LOCALAPPDATA", ""), "Programs", "Notion", "Notion.exe")),
             ("Obsidian", os.path.join(os.environ.get("LOCALAPPDATA", ""), "Obsidian", "Obsidian.exe")),
         ]
+
+    @staticmethod
+    def _scan_bases() -> list[str]:
+        """Folders whose app subfolders are scanned for executables."""
+        return [
+            os.path.join(os.environ.get("LOCALAPPDATA", ""), "Programs"),
+            os.environ.get("PROGRAMFILES", ""),
+        ]
+
+    def _installed_apps_signature(self) -> dict[str, int]:
+        """Mtimes of every folder whose entries feed _find_installed_apps."""
+        # Directory mtimes only change when entries are added or removed,
+        # which is exactly when an install/uninstall could alter the result.
+        local = os.environ.get("LOCALAPPDATA", "")
+        watched_dirs = [
+            local,
+            os.path.join(local, "Programs"),
+            os.environ.get("APPDATA", ""),
+            os.environ.get("PROGRAMFILES", ""),
+            os.environ.get("PROGRAMFILES(X86)", ""),
+        ]
+        # Folders holding the known popular-app executables
+        for _name, path in self._popular_app_paths():
+            watched_dirs.append(os.path.dirname(path.split(" --processStart")[0]))
+        mtimes = {}
+        for path in watched_dirs:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+        
+        # Each app folder the scan lists; on Windows scandir entries carry
+        # their stat data, so this costs one listing per base folder
+        for search_base in self._scan_bases():
+            try:
+                with os.scandir(search_base) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                mtimes[entry.path] = entry.stat().st_mtime_ns
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return mtimes
+
+    def _find_installed_apps(self) -> list[tuple[str, str]]:
+        """Find installed Windows applications (optimized)."""
+        max_apps = 200  # Limit to prevent slowdown
+        
+        # Add common Windows apps first (instant)
+        common_apps = [
+            ("Calculadora", "calc"),
+            ("Bloco de Notas", "notepad"),
+            ("Paint", "mspaint"),
+            ("WordPad", "wordpad"),
+            ("Prompt de Comando", "cmd"),
+            ("PowerShell", "powershell"),
+            ("Explorador de Arquivos", "explorer"),
+            ("Ferramenta de Captura", "snippingtool"),
+        ]
+        # Name -> path; the first entry found for a name wins
+        apps: dict[str, str] = dict(common_apps)
+        
+        # Add popular apps with known paths
+        popular_apps = self._popular_app_paths()
         
         # Add popular apps that exist
         for name, path in popular_apps:
             if os.path.exists(path) or (" --processStart" in path and os.path.exists(path.split(" --processStart")[0])):
-                if not any(name == n for n, _ in apps):
-                    apps.append((name, path))
+                if name not in apps:
+                    apps[name] = path
         
         # Quick scan of common app locations
-        quick_paths = [
-            (os.environ.get("LOCALAPPDATA", ""), "Programs"),
-            (os.environ.get("PROGRAMFILES", ""), ""),
-        ]
-        
-        import glob
         scanned = 0
         
-        for base, subdir in quick_paths:
+        for search_base in self._scan_bases():
             if scanned >= max_apps:
                 break
-                
-            search_base = os.path.join(base, subdir) if subdir else base
-            if not os.path.exists(search_base):
-                continue
             
-            # Only scan top-level directories and one level deep
+            # Only scan top-level directories and one level deep.
+            # scandir entries carry their type, so no extra stat per entry.
             try:
-                for item in os.listdir(search_base):
-                    if scanned >= max_apps:
-                        break
-                    
-                    item_path = os.path.join(search_base, item)
-                    if not os.path.isdir(item_path):
-                        continue
-                    
-                    # Look for .exe in this folder only
-                    for exe_file in glob.glob(os.path.join(item_path, "*.exe")):
+                with os.scandir(search_base) as entries:
+                    for entry in entries:
                         if scanned >= max_apps:
                             break
                         
+                        if not entry.is_dir():
+                            continue
+                        
+                        # Look for .exe in this folder only
                         try:
-                            exe_name = os.path.basename(exe_file)
-                            exe_lower = exe_name.lower()
+                            with os.scandir(entry.path) as files:
+                                exe_entries = [
+                                    f for f in files
+                                    if f.name.lower().endswith(".exe") and f.is_file()
+                                ]
+                        except OSError:
+                            continue
+                        
+                        for exe_entry in exe_entries:
+                            if scanned >= max_apps:
+                                break
                             
-                            # Skip unwanted files
-                            if any(skip in exe_lower for skip in [
-                                'unins', 'update', 'install', 'setup', 
-                                'crash', 'helper', 'service', 'launcher'
-                            ]):
+                            try:
+                                exe_name = exe_entry.name
+                                exe_lower = exe_name.lower()
+                                
+                                # Skip unwanted files
+                                if self._SKIP_EXE_RE.search(exe_lower):
+                                    continue
+                                
+                                # Get clean app name
+                                app_name = os.path.splitext(exe_name)[0]
+                                app_name = app_name.replace('_', ' ').replace('-', ' ').title()
+                                
+                                # Avoid duplicates
+                                if app_name not in apps:
+                                    apps[app_name] = exe_entry.path
+                                    scanned += 1
+                            except:
                                 continue
-                            
-                            # Get clean app name
-                            app_name = os.path.splitext(exe_name)[0]
-                            app_name = app_name.replace('_', ' ').replace('-', ' ').title()
-                            
-                            # Avoid duplicates
-                            if not any(app_name == name for name, _ in apps):
-                                apps.append((app_name, exe_file))
-                                scanned += 1
-                        except:
-                            continue
             except:
                 continue
         
-        return apps
+        return list(apps.items())
     
     def _load_data(self) -> None:
         """Load existing app data into fields."""
@@ -1033,6 +1438,17 @@ class AppEditorDialog(QDialog):
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+class _LaunchTask(QRunnable):
+    """Runs a blocking app/URL launch on the global thread pool."""
+
+    def __init__(self, launch: Callable[[], None]) -> None:
+        super().__init__()
+        self.launch = launch
+
+    def run(self) -> None:
+        self.launch()
+
+
 class DynamicIslandWindow(QWidget):
     """The floating pill-shaped launcher widget with spring-like animations."""
 
@@ -1042,6 +1458,18 @@ class DynamicIslandWindow(QWidget):
     EXPANDED_HEIGHT = 90
     TOP_MARGIN = 12
     CORNER_RADIUS = 14
+    # Quantization steps per animated background value in the pixmap cache
+    BG_CACHE_LEVELS = 64
+    BG_CACHE_MAX_ENTRIES = 32
+    # Rounded-rect window masks kept across resizes (animation frames repeat)
+    MASK_CACHE_MAX_ENTRIES = 128
+    # Reference size of the cached highlight strips, stretched to any width
+    HIGHLIGHT_STRIP_WIDTH = 256
+    HIGHLIGHT_STRIP_HEIGHT = 4
+
+    # Resolved executable per launcher name (None = not installed); filled
+    # once per process so clicks never hit the filesystem again
+    _app_paths: dict[str, str | None] = {}
 
     def __init__(self) -> None:
         super().__init__()
@@ -1055,6 +1483,7 @@ class DynamicIslandWindow(QWidget):
             app_dir = Path(__file__).parent
         
         self.config_path = app_dir / "config.json"
+        self._config_cache: tuple[int, dict] | None = None  # (mtime_ns, parsed)
         self.config = self._load_config()
         
         # Apply config values
@@ -1079,6 +1508,7 @@ class DynamicIslandWindow(QWidget):
         self._corner_radius = float(self.CORNER_RADIUS)
         self._music_player_visible = False
         self._drag_position = None
+        self._drag_target: QPoint | None = None  # Latest window pos while dragging
         self._is_hidden = False
         self._pulse_phase = 0.0  # For pulse animation in collapsed state
         self._is_playing = False  # Track music playing state
@@ -1086,6 +1516,25 @@ class DynamicIslandWindow(QWidget):
         self._border_glow = 0.0  # For border glow effect
         self._is_pinned = False  # Pin state - keeps island expanded
         self._is_dnd = False  # Do Not Disturb mode - blocks notifications
+        self._fade_buttons: list[GlowButton] = []  # Every button contentOpacity fades
+        # Rendered pill backgrounds keyed by (lightness, shadow, glow, dpr);
+        # the values are quantized only while they are animating
+        self._bg_cache: dict[tuple[float, float, float, float], QPixmap] = {}
+        # Drop-shadow 9-patch templates keyed by (quantized shadow, dpr)
+        self._shadow_cache: dict[tuple[int, float], tuple[QPixmap, int, int]] = {}
+        # Window mask regions keyed by (width, height, radius)
+        self._mask_cache: dict[tuple[int, int, float], QRegion] = {}
+        # Top/bottom highlight lines keyed by (is_top, alpha, dpr)
+        self._highlight_cache: dict[tuple[bool, int, float], QPixmap] = {}
+        # Primary screen work area and centered x per width, refreshed only
+        # when the screen setup changes
+        self._cached_screen_rect: QRect | None = None
+        self._target_x: dict[int, int] = {}
+        self._watch_screen(QGuiApplication.primaryScreen())
+        app = QGuiApplication.instance()
+        app.primaryScreenChanged.connect(self._on_primary_screen_changed)
+        app.screenAdded.connect(self._invalidate_screen_rect)
+        app.screenRemoved.connect(self._invalidate_screen_rect)
         
         # Pulse animation timer for collapsed indicator
         self._pulse_timer = QTimer(self)
@@ -1098,15 +1547,17 @@ class DynamicIslandWindow(QWidget):
         self._geom_anim.setDuration(500)
         self._geom_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
 
-        # Content fade animation (smoother)
-        self._opacity_anim = QPropertyAnimation(self, b"contentOpacity")
-        self._opacity_anim.setDuration(350)
-        self._opacity_anim.setEasingCurve(QEasingCurve.Type.InOutSine)
-
-        # Background lightness animation (smoother)
-        self._bg_anim = QPropertyAnimation(self, b"bgLightness")
-        self._bg_anim.setDuration(400)
-        self._bg_anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+        # Content fade + background lightness, driven together by one 0→1
+        # animation so each tick is a single Python slot call and repaint
+        self._fade_anim = QVariantAnimation(self)
+        self._fade_anim.setStartValue(0.0)
+        self._fade_anim.setEndValue(1.0)
+        self._fade_anim.setDuration(400)
+        self._fade_anim.setEasingCurve(QEasingCurve.Type.InOutSine)
+        self._fade_anim.valueChanged.connect(self._on_fade_step)
+        # Endpoints of the running fade, and the targets the next one heads to
+        self._opacity_from = self._opacity_to = self._next_opacity = self._content_opacity
+        self._bg_from = self._bg_to = self._next_bg = self._bg_lightness
         
         # Shadow intensity animation
         self._shadow_anim = QPropertyAnimation(self, b"shadowIntensity")
@@ -1118,12 +1569,14 @@ class DynamicIslandWindow(QWidget):
         self._border_glow_anim.setDuration(500)
         self._border_glow_anim.setEasingCurve(QEasingCurve.Type.InOutSine)
 
-        # Collapse timer
-        self._collapse_timer = QTimer(self)
-        collapse_delay = self.config.get("auto_collapse_delay", 3000)
-        self._collapse_timer.setInterval(collapse_delay)
-        self._collapse_timer.setSingleShot(True)
-        self._collapse_timer.timeout.connect(self.collapse)
+        # Drag moves are applied at most once per frame (~60 FPS)
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setInterval(16)
+        self._drag_timer.timeout.connect(self._apply_drag)
+
+        # Collapse timer (signal-free; fires through timerEvent)
+        self._collapse_timer = QBasicTimer()
+        self._collapse_delay_ms = int(self.config.get("auto_collapse_delay", 3000))
         
         # Notification system - initialize BEFORE _build_ui
         self._notification_label = None  # Will be created in _build_ui
@@ -1131,6 +1584,7 @@ class DynamicIslandWindow(QWidget):
         self._notification_timer.setSingleShot(True)
         self._notification_timer.timeout.connect(self._hide_notification)
         self._notification_history = []  # Store notification history
+        self._err_dlg: QMessageBox | None = None  # Reused by _show_error
 
         self._build_ui()
         # Hide button container initially (collapsed state)
@@ -1147,12 +1601,22 @@ class DynamicIslandWindow(QWidget):
             keyboard.add_hotkey('ctrl+1', self._toggle_visibility)
             keyboard.add_hotkey('ctrl+3', self._test_notification)  # Test notifications
             keyboard.add_hotkey('ctrl+4', self._show_notification_history)  # Show history
+
+        # Resolve launcher executables off the UI thread ahead of first use
+        QThreadPool.globalInstance().start(self._warm_app_paths)
     
     def _load_config(self) -> dict:
-        """Load configuration from JSON file."""
-        if self.config_path.exists():
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        """Load configuration from JSON file, reparsing only if it changed."""
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        if mtime_ns is not None:
+            if self._config_cache is not None and self._config_cache[0] == mtime_ns:
+                return self._config_cache[1]
+            config = _json_loads(self.config_path.read_bytes())
+            self._config_cache = (mtime_ns, config)
+            return config
         return {
             "apps": [],
             "music_controls_enabled": True,
@@ -1169,11 +1633,9 @@ class DynamicIslandWindow(QWidget):
     @contentOpacity.setter
     def contentOpacity(self, value: float) -> None:
         self._content_opacity = value
-        # Update button container opacity
-        if hasattr(self, "_button_container"):
-            effect = self._button_container.graphicsEffect()
-            if isinstance(effect, QGraphicsOpacityEffect):
-                effect.setOpacity(value)
+        # Fade the buttons themselves instead of an offscreen opacity effect
+        for btn in self._fade_buttons:
+            btn.setAlpha(value)
 
     @pyqtProperty(float)
     def bgLightness(self) -> float:
@@ -1244,11 +1706,9 @@ class DynamicIslandWindow(QWidget):
         # Single container for all controls
         self._button_container = QWidget()
         self._button_container.setStyleSheet("background: transparent;")
-        opacity_effect = QGraphicsOpacityEffect(self._button_container)
-        opacity_effect.setOpacity(0.0)
-        self._button_container.setGraphicsEffect(opacity_effect)
 
         btn_layout = QHBoxLayout(self._button_container)
+        self._btn_layout = btn_layout
         btn_layout.setContentsMargins(20, 0, 20, 0)
         btn_layout.setSpacing(12)
         btn_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1276,9 +1736,11 @@ class DynamicIslandWindow(QWidget):
         btn_layout.addWidget(self._music_controls)
 
         # Add app launcher buttons
-        for svg, tip, action, color in self._button_specs():
+        self._app_buttons: dict[str, GlowButton] = {}
+        for key, (svg, tip, action, color) in self._app_button_specs().items():
             btn = GlowButton(svg, tip, action, color)
             btn_layout.addWidget(btn)
+            self._app_buttons[key] = btn
         
         # Add settings menu button (contains all options)
         self._menu_btn = GlowButton(ICON_SETTINGS, "Menu", self._show_settings_menu, "#888888")
@@ -1286,9 +1748,9 @@ class DynamicIslandWindow(QWidget):
         btn_layout.addWidget(self._menu_btn)
         
         # Add close button at the end
-        close_btn = GlowButton(ICON_CLOSE, "Fechar Dynamic Island", self._close_app, "#FF4444")
-        close_btn.setFixedSize(40, 40)
-        btn_layout.addWidget(close_btn)
+        self._close_btn = GlowButton(ICON_CLOSE, "Fechar Dynamic Island", self._close_app, "#FF4444")
+        self._close_btn.setFixedSize(40, 40)
+        btn_layout.addWidget(self._close_btn)
 
         # Notification area (hidden by default) - ABOVE buttons
         self._notification_label = QLabel()
@@ -1310,9 +1772,13 @@ class DynamicIslandWindow(QWidget):
         layout.addWidget(self._button_container, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.addStretch()
 
+        # Buttons start at the current (faded out) content opacity
+        self._bind_fade_buttons()
+        self.contentOpacity = self._content_opacity
+
     def _button_specs(
         self,
-    ) -> list[tuple[str, str, Callable[[], None], str]]:
+    ) -> list[tuple[bytes, str, Callable[[], None], str]]:
         """Generate button specs from configuration."""
         buttons = []
         
@@ -1321,30 +1787,14 @@ class DynamicIslandWindow(QWidget):
             if not app.get("enabled", True):
                 continue
             
-            # Map icon names to actual SVG icons
-            icon_map = {
-                "ICON_WHATSAPP": ICON_WHATSAPP,
-                "ICON_FACEBOOK": ICON_FACEBOOK,
-                "ICON_LINKEDIN": ICON_LINKEDIN,
-                "ICON_VSCODE": ICON_VSCODE,
-                "ICON_BRAVE": ICON_BRAVE,
-                "ICON_NOTES": ICON_NOTES,
-                "ICON_MUSIC": ICON_MUSIC,
-            }
-            
             # Get icon SVG or create custom emoji icon
-            icon_svg = icon_map.get(app.get("icon_name", ""), None)
+            icon_svg = APP_ICONS.get(app.get("icon_name", ""), None)
             if not icon_svg and app.get("custom_icon"):
                 # Create simple SVG with emoji/text
-                emoji = app.get("custom_icon", "•")
-                icon_svg = f'''<svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
-                    <text x="12" y="16" text-anchor="middle" font-size="14" fill="{app.get('color', '#888888')}">{emoji}</text>
-                </svg>'''
+                icon_svg = _text_icon(app.get("custom_icon", "•"), app.get("color", "#888888"))
             elif not icon_svg:
                 # Default icon
-                icon_svg = f'''<svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
-                    <circle cx="12" cy="12" r="8" fill="{app.get('color', '#888888')}"/>
-                </svg>'''
+                icon_svg = _dot_icon(app.get("color", "#888888"))
             
             # Create action callback
             action = self._create_app_action(app)
@@ -1358,6 +1808,59 @@ class DynamicIslandWindow(QWidget):
         
         return buttons
     
+    def _app_button_specs(
+        self,
+    ) -> dict[str, tuple[bytes, str, Callable[[], None], str]]:
+        """Button specs keyed by app name (repeated names get a suffix)."""
+        specs = {}
+        for spec in self._button_specs():
+            key = spec[1]
+            n = 2
+            while key in specs:
+                key = f"{spec[1]} ({n})"
+                n += 1
+            specs[key] = spec
+        return specs
+
+    def _rebuild_buttons(self) -> None:
+        """Sync the app buttons with the config, touching only what changed."""
+        specs = self._app_button_specs()
+
+        # Drop buttons whose app was removed or disabled
+        for key in self._app_buttons.keys() - specs.keys():
+            btn = self._app_buttons.pop(key)
+            self._btn_layout.removeWidget(btn)
+            btn.deleteLater()
+
+        # App buttons sit right after the music controls, in config order
+        first_index = self._btn_layout.indexOf(self._music_controls) + 1
+        buttons: dict[str, GlowButton] = {}
+        for index, (key, (svg, tip, action, color)) in enumerate(specs.items(), first_index):
+            btn = self._app_buttons.get(key)
+            if btn is None:
+                btn = GlowButton(svg, tip, action, color)
+                btn.setAlpha(self._content_opacity)
+                self._btn_layout.insertWidget(index, btn)
+            else:
+                if btn.svg_data != svg:
+                    btn.setIcon(svg)
+                btn.setAccent(color)
+                btn.callback = action
+                if self._btn_layout.indexOf(btn) != index:
+                    self._btn_layout.removeWidget(btn)
+                    self._btn_layout.insertWidget(index, btn)
+            buttons[key] = btn
+        self._app_buttons = buttons
+        self._bind_fade_buttons()
+
+    def _bind_fade_buttons(self) -> None:
+        """Keep a direct list of the buttons the contentOpacity setter fades."""
+        self._fade_buttons = [
+            self._prev_btn, self._play_pause_btn, self._next_btn,
+            *self._app_buttons.values(),
+            self._menu_btn, self._close_btn,
+        ]
+
     def _create_app_action(self, app: dict) -> Callable[[], None]:
         """Create action callback for an app."""
         app_type = app.get("type", "local")
@@ -1365,48 +1868,69 @@ class DynamicIslandWindow(QWidget):
         
         if app_type == "url":
             url = app.get("url", "")
-            return lambda: self._open_url(url)
+            return lambda: self._launch(lambda: self._open_url(url))
         elif app_type == "local":
             # Check for predefined local apps
             if app_name == "WhatsApp":
-                return self._open_whatsapp
+                return lambda: self._launch(self._open_whatsapp)
             elif app_name == "LinkedIn":
-                return self._open_linkedin
+                return lambda: self._launch(self._open_linkedin)
             elif app_name == "VS Code":
-                return self._open_vscode
+                return lambda: self._launch(self._open_vscode)
             elif app_name == "Brave":
-                return self._open_brave
+                return lambda: self._launch(self._open_brave)
             elif app_name == "Sticky Notes":
-                return self._open_sticky
+                return lambda: self._launch(self._open_sticky)
             else:
                 # Custom local app
                 path = app.get("path", "")
-                return lambda p=path: self._run_custom_app(p)
+                return lambda p=path: self._launch(lambda: self._run_custom_app(p))
         elif app_type == "special":
             if app_name == "Music Player":
                 return self._toggle_music_player
         
         return lambda: None
+
+    @staticmethod
+    def _launch(launch: Callable[[], None]) -> None:
+        """Run a launch helper off the UI thread so animations keep running."""
+        QThreadPool.globalInstance().start(_LaunchTask(launch))
     
     def _run_custom_app(self, path: str) -> None:
         """Run a custom app from path or command."""
+        import subprocess
         try:
             if os.path.exists(path):
                 subprocess.Popen([path])
             else:
                 subprocess.Popen(path, shell=True)
         except Exception as exc:
-            self._show_error(f"Erro ao abrir {path}: {exc}")
+            self._queue_error(f"Erro ao abrir {path}: {exc}")
 
     # ─── Geometry helpers ─────────────────────────────────────────────────────
+    def _watch_screen(self, screen) -> None:
+        """Drop the cached geometry whenever screen's work area changes."""
+        screen.availableGeometryChanged.connect(self._invalidate_screen_rect)
+
+    def _on_primary_screen_changed(self, screen) -> None:
+        self._watch_screen(screen)
+        self._invalidate_screen_rect()
+
+    def _invalidate_screen_rect(self, *_args) -> None:
+        self._cached_screen_rect = None
+        self._target_x.clear()
+
     def _screen_rect(self) -> QRect:
-        return QGuiApplication.primaryScreen().availableGeometry()
+        if self._cached_screen_rect is None:
+            self._cached_screen_rect = QGuiApplication.primaryScreen().availableGeometry()
+        return self._cached_screen_rect
 
     def _target_rect(self, w: int, h: int) -> QRect:
-        screen = self._screen_rect()
-        x = screen.x() + (screen.width() - w) // 2
-        y = screen.y() + self.TOP_MARGIN
-        return QRect(x, y, w, h)
+        x = self._target_x.get(w)
+        if x is None:
+            screen = self._screen_rect()
+            x = self._target_x[w] = screen.x() + (screen.width() - w) // 2
+        return QRect(x, self._screen_rect().y() + self.TOP_MARGIN, w, h)
 
     def _set_geometry(self, w: int, h: int) -> None:
         self.setGeometry(self._target_rect(w, h))
@@ -1436,9 +1960,10 @@ class DynamicIslandWindow(QWidget):
         self._animate_shadow(1.0)  # Increase shadow
         self._animate_border_glow(0.6)  # Add subtle border glow
         
-        # Delay opacity slightly for smoother feel
-        QTimer.singleShot(80, lambda: self._animate_opacity(1.0))
-        QTimer.singleShot(50, lambda: self._animate_bg(0.15))
+        # Delay the fade slightly for smoother feel
+        self._animate_opacity(1.0)
+        self._animate_bg(0.15)
+        QTimer.singleShot(50, self._start_fade)
         
         self._collapse_timer.stop()
 
@@ -1452,6 +1977,7 @@ class DynamicIslandWindow(QWidget):
         self._animate_shadow(0.0)
         self._animate_border_glow(0.0)
         self._animate_bg(0.0)
+        self._start_fade()
         
         # Delay geometry change for smoother transition
         QTimer.singleShot(150, self._do_collapse_geometry)
@@ -1487,16 +2013,27 @@ class DynamicIslandWindow(QWidget):
             self._button_container.setVisible(False)
 
     def _animate_opacity(self, target: float) -> None:
-        self._opacity_anim.stop()
-        self._opacity_anim.setStartValue(self._content_opacity)
-        self._opacity_anim.setEndValue(target)
-        self._opacity_anim.start()
+        """Set the content opacity the next _start_fade() heads to."""
+        self._next_opacity = target
 
     def _animate_bg(self, target: float) -> None:
-        self._bg_anim.stop()
-        self._bg_anim.setStartValue(self._bg_lightness)
-        self._bg_anim.setEndValue(target)
-        self._bg_anim.start()
+        """Set the background lightness the next _start_fade() heads to."""
+        self._next_bg = target
+
+    def _start_fade(self) -> None:
+        """(Re)start the fade from the current values towards the targets."""
+        self._fade_anim.stop()
+        self._opacity_from = self._content_opacity
+        self._bg_from = self._bg_lightness
+        # A running fade keeps its own endpoints until it is replaced here
+        self._opacity_to = self._next_opacity
+        self._bg_to = self._next_bg
+        self._fade_anim.start()
+
+    def _on_fade_step(self, t: float) -> None:
+        self.contentOpacity = self._opacity_from + (self._opacity_to - self._opacity_from) * t
+        self._bg_lightness = self._bg_from + (self._bg_to - self._bg_from) * t
+        self.update()
 
     # ─── Events ───────────────────────────────────────────────────────────────
     def enterEvent(self, _event) -> None:
@@ -1509,7 +2046,7 @@ class DynamicIslandWindow(QWidget):
     def focusOutEvent(self, _event) -> None:
         """Collapse when window loses focus (click outside)."""
         if not self._is_pinned:
-            self._collapse_timer.start()
+            self._collapse_timer.start(self._collapse_delay_ms, self)
     
     def event(self, event) -> bool:
         """Handle activation/deactivation events."""
@@ -1517,24 +2054,42 @@ class DynamicIslandWindow(QWidget):
         if event.type() == QEvent.Type.WindowDeactivate:
             # Window lost focus - collapse if not pinned
             if not self._is_pinned:
-                self._collapse_timer.start()
+                self._collapse_timer.start(self._collapse_delay_ms, self)
         elif event.type() == QEvent.Type.WindowActivate:
             # Window gained focus - cancel collapse
             self._collapse_timer.stop()
         return super().event(event)
 
+    def timerEvent(self, event) -> None:
+        if event.timerId() == self._collapse_timer.timerId():
+            # Single shot: QBasicTimer repeats until stopped
+            self._collapse_timer.stop()
+            self.collapse()
+        else:
+            super().timerEvent(event)
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
             self._drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            self._drag_timer.start()
             event.accept()
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if event.buttons() == Qt.MouseButton.LeftButton and self._drag_position is not None:
-            self.move(event.globalPosition().toPoint() - self._drag_position)
+            # Only remember the newest position; _drag_timer applies it
+            self._drag_target = event.globalPosition().toPoint() - self._drag_position
             event.accept()
 
+    def _apply_drag(self) -> None:
+        """Move the window to the latest drag position, if it changed."""
+        if self._drag_target is not None:
+            self.move(self._drag_target)
+            self._drag_target = None
+
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_timer.stop()
+            self._apply_drag()
             self._drag_position = None
             # Recenter horizontally when released
             screen = self._screen_rect()
@@ -1550,38 +2105,98 @@ class DynamicIslandWindow(QWidget):
         if not self.expanded:
             self.update()  # Only repaint when collapsed
     
+    def resizeEvent(self, event) -> None:
+        # Cached backgrounds are rendered for a single size
+        self._bg_cache.clear()
+        self._update_mask()
+        super().resizeEvent(event)
+
+    def _update_mask(self) -> None:
+        """Clip the window to the pill so the compositor skips the corners.
+
+        The mask is aliased, so on HiDPI screens (where the pill edge is
+        drawn with sub-pixel antialiasing) the full translucent window is kept.
+        """
+        if self.devicePixelRatioF() > 1:
+            self.clearMask()
+            return
+        key = (self.width(), self.height(), self._corner_radius)
+        region = self._mask_cache.get(key)
+        if region is None:
+            if len(self._mask_cache) >= self.MASK_CACHE_MAX_ENTRIES:
+                self._mask_cache.clear()
+            path = QPainterPath()
+            path.addRoundedRect(QRectF(self.rect()), self._corner_radius, self._corner_radius)
+            region = QRegion(path.toFillPolygon().toPolygon())
+            self._mask_cache[key] = region
+        self.setMask(region)
+
     def paintEvent(self, _event) -> None:
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
         rect = self.rect()
+
+        if self._geom_anim.state() == QPropertyAnimation.State.Running:
+            # The size changes every frame, a cached pixmap would never hit
+            self._paint_background(
+                painter, rect, self._bg_lightness, self._shadow_intensity, self._border_glow
+            )
+        else:
+            painter.drawPixmap(0, 0, self._cached_background(rect))
+        
+        # Draw animated indicator when collapsed (enhanced)
+        if not self.expanded and rect.width() <= 100:
+            self._draw_collapsed_indicator(painter, rect)
+
+    def _cached_background(self, rect: QRect) -> QPixmap:
+        """Return the pill background for the current state, rendering it on a miss."""
+        values = (self._bg_lightness, self._shadow_intensity, self._border_glow)
+        animating = any(
+            anim.state() == QPropertyAnimation.State.Running
+            for anim in (self._fade_anim, self._shadow_anim, self._border_glow_anim)
+        )
+        if animating:
+            # Mid-animation frames share BG_CACHE_LEVELS steps per value;
+            # settled states are rendered from their exact values
+            levels = self.BG_CACHE_LEVELS
+            values = tuple(round(v * levels) / levels for v in values)
+        dpr = self.devicePixelRatioF()
+        key = (*values, dpr)
+        pixmap = self._bg_cache.get(key)
+        if pixmap is None:
+            if len(self._bg_cache) >= self.BG_CACHE_MAX_ENTRIES:
+                self._bg_cache.clear()
+            pixmap = QPixmap(QSize(math.ceil(rect.width() * dpr), math.ceil(rect.height() * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            pix_painter = QPainter(pixmap)
+            pix_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._paint_background(pix_painter, rect, *values)
+            pix_painter.end()
+            self._bg_cache[key] = pixmap
+        return pixmap
+
+    def _paint_background(
+        self, painter: QPainter, rect: QRect, lightness: float, shadow: float, border_glow: float
+    ) -> None:
+        """Paint shadow, border glow, pill body and highlight lines."""
         radius = self._corner_radius
 
         # Background color with subtle lightness shift
-        base = int(8 + 22 * self._bg_lightness)
+        base = int(8 + 22 * lightness)
         bg_color = QColor(base, base, base + 2, 250)
 
-        # Enhanced drop shadow (more layers, smoother)
-        shadow_layers = int(5 + 3 * self._shadow_intensity)
-        for i in range(shadow_layers, 0, -1):
-            shadow_alpha = int((15 + 25 * self._shadow_intensity) * (shadow_layers - i + 1) / shadow_layers)
-            shadow_color = QColor(0, 0, 0, shadow_alpha)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(shadow_color)
-            inflate = int(i * (1.5 + self._shadow_intensity))
-            painter.drawRoundedRect(
-                rect.adjusted(-inflate, -inflate, inflate, inflate), 
-                radius + inflate, 
-                radius + inflate
-            )
+        # Enhanced drop shadow, blitted from a pre-rendered template
+        self._paint_shadow(painter, rect, shadow)
 
         # Outer glow when expanded (subtle blue tint)
-        if self._border_glow > 0.01:
-            glow_color = QColor(80, 160, 255, int(30 * self._border_glow))
+        if border_glow > 0.01:
+            glow_color = QColor(80, 160, 255, int(30 * border_glow))
             for i in range(3):
-                glow_color.setAlpha(int((20 - i * 6) * self._border_glow))
-                inflate = int((3 + i * 2) * self._border_glow)
+                glow_color.setAlpha(int((20 - i * 6) * border_glow))
+                inflate = int((3 + i * 2) * border_glow)
                 painter.setBrush(glow_color)
                 painter.drawRoundedRect(
                     rect.adjusted(-inflate, -inflate, inflate, inflate),
@@ -1597,48 +2212,140 @@ class DynamicIslandWindow(QWidget):
         
         painter.setBrush(bg_gradient)
         border_color = QColor(
-            int(60 + 30 * self._border_glow), 
-            int(60 + 40 * self._border_glow), 
-            int(65 + 50 * self._border_glow),
-            int(180 + 75 * self._bg_lightness)
+            int(60 + 30 * border_glow), 
+            int(60 + 40 * border_glow), 
+            int(65 + 50 * border_glow),
+            int(180 + 75 * lightness)
         )
-        painter.setPen(QPen(border_color, 1.0 + 0.5 * self._border_glow))
+        painter.setPen(QPen(border_color, 1.0 + 0.5 * border_glow))
         painter.drawRoundedRect(QRectF(rect), radius, radius)
 
         # Top highlight line (simulates light reflection) - enhanced
-        highlight = QLinearGradient(rect.left(), rect.top(), rect.right(), rect.top())
-        highlight_intensity = int(22 + 18 * self._bg_lightness)
-        highlight.setColorAt(0, QColor(255, 255, 255, 0))
-        highlight.setColorAt(0.3, QColor(255, 255, 255, highlight_intensity // 2))
-        highlight.setColorAt(0.5, QColor(255, 255, 255, highlight_intensity))
-        highlight.setColorAt(0.7, QColor(255, 255, 255, highlight_intensity // 2))
-        highlight.setColorAt(1, QColor(255, 255, 255, 0))
-        painter.setPen(QPen(QBrush(highlight), 1.2))
-        painter.drawLine(
-            int(rect.left() + radius),
-            rect.top() + 1,
-            int(rect.right() - radius),
-            rect.top() + 1,
-        )
+        self._paint_highlight(painter, rect, int(22 + 18 * lightness), top=True)
         
         # Inner edge highlight (bottom)
-        if self._bg_lightness > 0.05:
-            bottom_highlight = QLinearGradient(rect.left(), rect.bottom(), rect.right(), rect.bottom())
-            bottom_highlight.setColorAt(0, QColor(255, 255, 255, 0))
-            bottom_highlight.setColorAt(0.5, QColor(255, 255, 255, int(8 * self._bg_lightness)))
-            bottom_highlight.setColorAt(1, QColor(255, 255, 255, 0))
-            painter.setPen(QPen(QBrush(bottom_highlight), 0.8))
-            painter.drawLine(
-                int(rect.left() + radius),
-                rect.bottom() - 1,
-                int(rect.right() - radius),
-                rect.bottom() - 1,
-            )
-        
-        # Draw animated indicator when collapsed (enhanced)
-        if not self.expanded and rect.width() <= 100:
-            self._draw_collapsed_indicator(painter, rect)
+        if lightness > 0.05:
+            self._paint_highlight(painter, rect, int(8 * lightness), top=False)
+
+    def _highlight_strip(self, alpha: int, top: bool) -> QPixmap:
+        """Return a highlight line rendered once at the reference strip width."""
+        dpr = self.devicePixelRatioF()
+        key = (top, alpha, dpr)
+        pixmap = self._highlight_cache.get(key)
+        if pixmap is None:
+            w, h = self.HIGHLIGHT_STRIP_WIDTH, self.HIGHLIGHT_STRIP_HEIGHT
+            pixmap = QPixmap(QSize(math.ceil(w * dpr), math.ceil(h * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            gradient = QLinearGradient(0, 0, w, 0)
+            gradient.setColorAt(0, QColor(255, 255, 255, 0))
+            if top:
+                gradient.setColorAt(0.3, QColor(255, 255, 255, alpha // 2))
+                gradient.setColorAt(0.7, QColor(255, 255, 255, alpha // 2))
+            gradient.setColorAt(0.5, QColor(255, 255, 255, alpha))
+            gradient.setColorAt(1, QColor(255, 255, 255, 0))
+
+            pix_painter = QPainter(pixmap)
+            pix_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            pix_painter.setPen(QPen(QBrush(gradient), 1.2 if top else 0.8))
+            # Same offset from the edge as the pill: 1px below top, 1px above bottom
+            y = 1 if top else h - 2
+            pix_painter.drawLine(0, y, w, y)
+            pix_painter.end()
+            self._highlight_cache[key] = pixmap
+        return pixmap
+
+    def _paint_highlight(self, painter: QPainter, rect: QRect, alpha: int, top: bool) -> None:
+        """Stretch the cached highlight strip along the top or bottom edge."""
+        radius = self._corner_radius
+        x0 = int(rect.left() + radius)
+        x1 = int(rect.right() - radius)
+        span = rect.right() - rect.left()
+        if x1 <= x0 or span <= 0:
+            return
+        strip = self._highlight_strip(alpha, top)
+        # The gradient spans the full pill width; crop the part under the line
+        scale = self.HIGHLIGHT_STRIP_WIDTH * strip.devicePixelRatio() / span
+        strip_h = self.HIGHLIGHT_STRIP_HEIGHT
+        y = rect.top() if top else rect.bottom() + 1 - strip_h
+        painter.drawPixmap(
+            QRectF(x0, y, x1 - x0, strip_h),
+            strip,
+            QRectF((x0 - rect.left()) * scale, 0, (x1 - x0) * scale, strip.height()),
+        )
     
+    def _paint_shadow_layers(self, painter: QPainter, rect: QRect, shadow: float) -> None:
+        """Draw the layered drop shadow around rect (more layers, smoother)."""
+        radius = self._corner_radius
+        shadow_layers = int(5 + 3 * shadow)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for i in range(shadow_layers, 0, -1):
+            shadow_alpha = int((15 + 25 * shadow) * (shadow_layers - i + 1) / shadow_layers)
+            painter.setBrush(QColor(0, 0, 0, shadow_alpha))
+            inflate = int(i * (1.5 + shadow))
+            painter.drawRoundedRect(
+                rect.adjusted(-inflate, -inflate, inflate, inflate), 
+                radius + inflate, 
+                radius + inflate
+            )
+
+    def _shadow_patch(self, shadow: float) -> tuple[QPixmap, int, int]:
+        """Return (template, spread, edge) for the drop shadow at this intensity.
+
+        The template is the shadow of a 2r x 2r pill, so its four corners are
+        exact and its centre row/column stretch to any larger size.
+        """
+        level = round(shadow * self.BG_CACHE_LEVELS)
+        dpr = self.devicePixelRatioF()
+        key = (level, dpr)
+        cached = self._shadow_cache.get(key)
+        if cached is not None:
+            return cached
+        if len(self._shadow_cache) >= self.BG_CACHE_MAX_ENTRIES:
+            self._shadow_cache.clear()
+
+        shadow = level / self.BG_CACHE_LEVELS
+        shadow_layers = int(5 + 3 * shadow)
+        spread = int(shadow_layers * (1.5 + shadow))
+        corner = math.ceil(self._corner_radius)
+        edge = spread + corner
+        side = math.ceil(2 * edge * dpr)
+        pixmap = QPixmap(QSize(side, side))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        pix_painter = QPainter(pixmap)
+        pix_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._paint_shadow_layers(pix_painter, QRect(spread, spread, 2 * corner, 2 * corner), shadow)
+        pix_painter.end()
+        self._shadow_cache[key] = (pixmap, spread, edge)
+        return pixmap, spread, edge
+
+    def _paint_shadow(self, painter: QPainter, rect: QRect, shadow: float) -> None:
+        """Blit the cached shadow template around rect as a 9-patch."""
+        corner = math.ceil(self._corner_radius)
+        if rect.width() < 2 * corner or rect.height() < 2 * corner:
+            self._paint_shadow_layers(painter, rect, shadow)
+            return
+
+        pixmap, spread, edge = self._shadow_patch(shadow)
+        dpr = pixmap.devicePixelRatio()
+        outer = rect.adjusted(-spread, -spread, spread, spread)
+        xs = (outer.left(), outer.left() + edge, outer.left() + outer.width() - edge, outer.left() + outer.width())
+        ys = (outer.top(), outer.top() + edge, outer.top() + outer.height() - edge, outer.top() + outer.height())
+        # Source spans in logical template pixels: corner, 1px stretch band, corner
+        src = ((0, edge), (edge - 1, 1), (edge, edge))
+        for row in range(3):
+            for col in range(3):
+                target = QRectF(xs[col], ys[row], xs[col + 1] - xs[col], ys[row + 1] - ys[row])
+                if target.isEmpty():
+                    continue
+                source = QRectF(src[col][0] * dpr, src[row][0] * dpr, src[col][1] * dpr, src[row][1] * dpr)
+                painter.drawPixmap(target, pixmap, source)
+        # Leave the painter as the layered fallback does: the glow rings
+        # drawn next rely on it having no pen
+        painter.setPen(Qt.PenStyle.NoPen)
+
     def _draw_collapsed_indicator(self, painter: QPainter, rect: QRect) -> None:
         """Draw the animated pulsing indicator when collapsed."""
         # Multi-phase pulse for more organic feel
@@ -1757,26 +2464,18 @@ class DynamicIslandWindow(QWidget):
         """Toggle music player controls visibility."""
         self._music_player_visible = not self._music_player_visible
         
-        if hasattr(self, "_music_controls"):
-            self._music_controls.setVisible(self._music_player_visible)
-            
-            # Recalculate and animate to new width when expanded
-            if self.expanded:
-                music_extra = 150 if self._music_player_visible else 0
-                new_width = self._calculate_expanded_width() + music_extra
-                self._animate_geometry(new_width, self.EXPANDED_HEIGHT)
+        self._music_controls.setVisible(self._music_player_visible)
+        
+        # Recalculate and animate to new width when expanded
+        if self.expanded:
+            music_extra = 150 if self._music_player_visible else 0
+            new_width = self._calculate_expanded_width() + music_extra
+            self._animate_geometry(new_width, self.EXPANDED_HEIGHT)
     
     def _music_play_pause(self) -> None:
         """Send play/pause command to Windows media."""
         try:
-            import ctypes
-            VK_MEDIA_PLAY_PAUSE = 0xB3
-            KEYEVENTF_EXTENDEDKEY = 0x0001
-            KEYEVENTF_KEYUP = 0x0002
-            
-            user32 = ctypes.windll.user32
-            user32.keybd_event(VK_MEDIA_PLAY_PAUSE, 0, KEYEVENTF_EXTENDEDKEY, 0)
-            user32.keybd_event(VK_MEDIA_PLAY_PAUSE, 0, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP, 0)
+            _send_media_key(VK_MEDIA_PLAY_PAUSE)
             
             # Toggle playing state and update icon
             self._is_playing = not self._is_playing
@@ -1793,28 +2492,14 @@ class DynamicIslandWindow(QWidget):
     def _music_prev(self) -> None:
         """Send previous track command."""
         try:
-            import ctypes
-            VK_MEDIA_PREV_TRACK = 0xB1
-            KEYEVENTF_EXTENDEDKEY = 0x0001
-            KEYEVENTF_KEYUP = 0x0002
-            
-            user32 = ctypes.windll.user32
-            user32.keybd_event(VK_MEDIA_PREV_TRACK, 0, KEYEVENTF_EXTENDEDKEY, 0)
-            user32.keybd_event(VK_MEDIA_PREV_TRACK, 0, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP, 0)
+            _send_media_key(VK_MEDIA_PREV_TRACK)
         except Exception as exc:
             self._show_error(f"Erro ao voltar faixa: {exc}")
     
     def _music_next(self) -> None:
         """Send next track command."""
         try:
-            import ctypes
-            VK_MEDIA_NEXT_TRACK = 0xB0
-            KEYEVENTF_EXTENDEDKEY = 0x0001
-            KEYEVENTF_KEYUP = 0x0002
-            
-            user32 = ctypes.windll.user32
-            user32.keybd_event(VK_MEDIA_NEXT_TRACK, 0, KEYEVENTF_EXTENDEDKEY, 0)
-            user32.keybd_event(VK_MEDIA_NEXT_TRACK, 0, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP, 0)
+            _send_media_key(VK_MEDIA_NEXT_TRACK)
         except Exception as exc:
             self._show_error(f"Erro ao avançar faixa: {exc}")
     
@@ -1867,11 +2552,21 @@ class DynamicIslandWindow(QWidget):
             self.config = self._load_config()
             
             # Update UI parameters
-            self.EXPANDED_WIDTH = self.config.get("expanded_width", 650)
-            self._collapse_timer.setInterval(self.config.get("auto_collapse_delay", 3000))
+            self._collapse_delay_ms = int(self.config.get("auto_collapse_delay", 3000))
             
-            # Rebuild UI with new apps
-            self._rebuild_ui()
+            # Update only the app buttons that changed, then resize to fit
+            self._rebuild_buttons()
+            self.EXPANDED_WIDTH = self._calculate_expanded_width()
+            
+            # Update music controls visibility
+            music_enabled = self.config.get("music_controls_enabled", True)
+            self._music_controls.setVisible(music_enabled)
+            
+            # Reset to collapsed state
+            if self.expanded:
+                self.collapse()
+            else:
+                self._set_geometry(self.COLLAPSED_WIDTH, self.COLLAPSED_HEIGHT)
             
             # Show success message
             QMessageBox.information(
@@ -1881,45 +2576,72 @@ class DynamicIslandWindow(QWidget):
                 QMessageBox.StandardButton.Ok
             )
     
-    def _rebuild_ui(self) -> None:
-        """Rebuild the UI with current configuration."""
-        # Remove old button container
-        if hasattr(self, '_button_container') and self._button_container:
-            self._button_container.setParent(None)
-            self._button_container.deleteLater()
-        
-        # Clear existing layout
-        old_layout = self.layout()
-        if old_layout:
-            while old_layout.count():
-                item = old_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-            QWidget().setLayout(old_layout)  # Transfer ownership to delete it
-        
-        # Rebuild UI
-        self._build_ui()
-        
-        # Update music controls visibility
-        music_enabled = self.config.get("music_controls_enabled", True)
-        if hasattr(self, '_music_controls'):
-            self._music_controls.setVisible(music_enabled)
-        
-        # Reset to collapsed state
-        if self.expanded:
-            self.collapse()
-        else:
-            self._set_geometry(self.COLLAPSED_WIDTH, self.COLLAPSED_HEIGHT)
-
     # ─── Launch helpers ───────────────────────────────────────────────────────
     def _open_url(self, url: str) -> None:
+        import webbrowser
         try:
             webbrowser.open(url, new=2)
         except Exception as exc:
-            self._show_error(f"Não foi possível abrir {url}: {exc}")
+            self._queue_error(f"Não foi possível abrir {url}: {exc}")
     
+    @staticmethod
+    def _app_locations() -> dict[str, tuple[list[str], str | None]]:
+        """Candidate executable paths and a fallback glob for each launcher."""
+        local = os.environ.get("LOCALAPPDATA", "")
+        program_files = os.environ.get("PROGRAMFILES", "")
+        program_files_x86 = os.environ.get("PROGRAMFILES(X86)", "")
+        windowsapps = os.path.join(program_files, "WindowsApps")
+        return {
+            "WhatsApp": (
+                [
+                    os.path.join(local, "WhatsApp", "WhatsApp.exe"),
+                    os.path.join(local, "Programs", "WhatsApp", "WhatsApp.exe"),
+                ],
+                os.path.join(windowsapps, "*WhatsApp*", "WhatsApp.exe"),
+            ),
+            "Brave": (
+                [
+                    os.path.join(program_files, "BraveSoftware", "Brave-Browser", "Application", "brave.exe"),
+                    os.path.join(program_files_x86, "BraveSoftware", "Brave-Browser", "Application", "brave.exe"),
+                    os.path.join(local, "BraveSoftware", "Brave-Browser", "Application", "brave.exe"),
+                ],
+                None,
+            ),
+            "VS Code": (
+                [
+                    os.path.join(local, "Programs", "Microsoft VS Code", "Code.exe"),
+                    os.path.join(program_files, "Microsoft VS Code", "Code.exe"),
+                ],
+                None,
+            ),
+            "Sticky Notes": (
+                [],
+                os.path.join(windowsapps, "Microsoft.MicrosoftStickyNotes*", "*.exe"),
+            ),
+        }
+
+    @classmethod
+    def _app_path(cls, name: str) -> str | None:
+        """Return the executable for a launcher, probing the disk only once."""
+        if name in cls._app_paths:
+            return cls._app_paths[name]
+        candidates, pattern = cls._app_locations()[name]
+        path = next((c for c in candidates if os.path.exists(c)), None)
+        if path is None and pattern:
+            import glob
+            path = next(iter(glob.glob(pattern)), None)
+        cls._app_paths[name] = path
+        return path
+
+    @classmethod
+    def _warm_app_paths(cls) -> None:
+        """Resolve every launcher executable (runs on a pool thread)."""
+        for name in cls._app_locations():
+            cls._app_path(name)
+
     def _open_whatsapp(self) -> None:
         """Open WhatsApp desktop app or web version."""
+        import subprocess
         try:
             # Try Windows Store app first
             try:
@@ -1928,24 +2650,10 @@ class DynamicIslandWindow(QWidget):
             except:
                 pass
             
-            # Try local executable paths
-            import glob
-            whatsapp_paths = [
-                os.path.join(os.environ.get("LOCALAPPDATA", ""), "WhatsApp", "WhatsApp.exe"),
-                os.path.join(os.environ.get("LOCALAPPDATA", ""), "Programs", "WhatsApp", "WhatsApp.exe"),
-            ]
-            for path in whatsapp_paths:
-                if os.path.exists(path):
-                    subprocess.Popen([path])
-                    return
-            
-            # Search in WindowsApps
-            windowsapps = os.path.join(os.environ.get("PROGRAMFILES", ""), "WindowsApps")
-            if os.path.exists(windowsapps):
-                matches = glob.glob(os.path.join(windowsapps, "*WhatsApp*", "WhatsApp.exe"))
-                if matches:
-                    subprocess.Popen([matches[0]])
-                    return
+            # Try local executable or WindowsApps install
+            if path := self._app_path("WhatsApp"):
+                subprocess.Popen([path])
+                return
             
             # Fallback to web
             self._open_url("https://web.whatsapp.com")
@@ -1963,52 +2671,45 @@ class DynamicIslandWindow(QWidget):
     
     def _open_brave(self) -> None:
         """Open Brave browser."""
+        import subprocess
         try:
             # Try common Brave installation paths
-            brave_paths = [
-                os.path.join(os.environ.get("PROGRAMFILES", ""), "BraveSoftware", "Brave-Browser", "Application", "brave.exe"),
-                os.path.join(os.environ.get("PROGRAMFILES(X86)", ""), "BraveSoftware", "Brave-Browser", "Application", "brave.exe"),
-                os.path.join(os.environ.get("LOCALAPPDATA", ""), "BraveSoftware", "Brave-Browser", "Application", "brave.exe"),
-            ]
-            for path in brave_paths:
-                if os.path.exists(path):
-                    subprocess.Popen([path])
-                    return
+            if path := self._app_path("Brave"):
+                subprocess.Popen([path])
+                return
             
             # Try command line
             subprocess.Popen(["brave"], shell=True)
         except Exception as exc:
-            self._show_error(f"Brave não encontrado: {exc}")
+            self._queue_error(f"Brave não encontrado: {exc}")
     
     def _open_vscode(self) -> None:
         """Open VS Code."""
+        import subprocess
         try:
             # Try common VS Code paths
-            vscode_paths = [
-                os.path.join(os.environ.get("LOCALAPPDATA", ""), "Programs", "Microsoft VS Code", "Code.exe"),
-                os.path.join(os.environ.get("PROGRAMFILES", ""), "Microsoft VS Code", "Code.exe"),
-            ]
-            for path in vscode_paths:
-                if os.path.exists(path):
-                    subprocess.Popen([path])
-                    return
+            if path := self._app_path("VS Code"):
+                subprocess.Popen([path])
+                return
             
             # Try command line
             subprocess.Popen(["code"], shell=True)
         except Exception as exc:
-            self._show_error(f"VS Code não encontrado: {exc}")
+            self._queue_error(f"VS Code não encontrado: {exc}")
     
     def _run_cmd(self, cmd: str) -> None:
         """Execute a shell command."""
+        import subprocess
         try:
             subprocess.Popen(cmd, shell=True, creationflags=subprocess.CREATE_NO_WINDOW)
         except FileNotFoundError:
-            self._show_error(f"'{cmd}' não encontrado no PATH.")
+            self._queue_error(f"'{cmd}' não encontrado no PATH.")
         except Exception as exc:
-            self._show_error(f"Erro ao executar '{cmd}': {exc}")
+            self._queue_error(f"Erro ao executar '{cmd}': {exc}")
 
     def _open_sticky(self) -> None:
         """Open Windows Sticky Notes app."""
+        import subprocess
         try:
             # Method 1: Try protocol handler
             try:
@@ -2024,19 +2725,15 @@ class DynamicIslandWindow(QWidget):
             except:
                 pass
             
-            # Method 3: Try searching for the app in common locations
-            import glob
-            windowsapps = os.path.join(os.environ.get("PROGRAMFILES", ""), "WindowsApps")
-            if os.path.exists(windowsapps):
-                matches = glob.glob(os.path.join(windowsapps, "Microsoft.MicrosoftStickyNotes*", "*.exe"))
-                if matches:
-                    subprocess.Popen([matches[0]])
-                    return
+            # Method 3: Try the app's executable under WindowsApps
+            if path := self._app_path("Sticky Notes"):
+                subprocess.Popen([path])
+                return
             
             # Method 4: Fallback
             subprocess.Popen(["cmd", "/c", "start", "ms-stickynotes:"])
         except Exception as exc:
-            self._show_error(f"Sticky Notes: {exc}")
+            self._queue_error(f"Sticky Notes: {exc}")
     
     # ─── Notification System ──────────────────────────────────────────────────
     def _start_notification_listener(self) -> None:
@@ -2212,8 +2909,7 @@ class DynamicIslandWindow(QWidget):
             return
         
         # Stop collapse timer while showing notification
-        if self._collapse_timer.isActive():
-            self._collapse_timer.stop()
+        self._collapse_timer.stop()
         
         # Get app icon emoji based on app name
         app_icons = {
@@ -2430,13 +3126,30 @@ class DynamicIslandWindow(QWidget):
         msg = random.choice(test_messages)
         self._show_notification(f"{app}: {msg}", app)
 
+    def _queue_error(self, msg: str) -> None:
+        """Queue an error dialog to be shown in the UI thread."""
+        QMetaObject.invokeMethod(
+            self,
+            "_show_error_slot",
+            Qt.ConnectionType.QueuedConnection,
+            Q_ARG(str, msg)
+        )
+
+    @pyqtSlot(str)
+    def _show_error_slot(self, msg: str) -> None:
+        """Slot to show an error (called from main thread)."""
+        self._show_error(msg)
+
     def _show_error(self, msg: str) -> None:
-        """Show error message dialog."""
-        dlg = QMessageBox()
-        dlg.setIcon(QMessageBox.Icon.Warning)
-        dlg.setWindowTitle("Dynamic Island")
-        dlg.setText(msg)
-        dlg.exec()
+        """Show error message dialog (one dialog reused for every error)."""
+        if self._err_dlg is None:
+            self._err_dlg = QMessageBox()
+            self._err_dlg.setIcon(QMessageBox.Icon.Warning)
+            self._err_dlg.setWindowTitle("Dynamic Island")
+        self._err_dlg.setText(msg)
+        # An error arriving while the dialog is open just replaces its text
+        if not self._err_dlg.isVisible():
+            self._err_dlg.exec()
 
 
 # ──────────────────────────────────────────────────────────────────────────────